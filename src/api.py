@@ -74,6 +74,7 @@ def _run_scrape_sync(req: ScrapeRequest) -> tuple[int, int]:
         return listings_total, pages
     finally:
         scraper.close()
+        data_manager.close()
 
 
 # NOTE: /scrape endpoint removed per requirements; only /scan is exposed
@@ -98,6 +99,7 @@ def start_scan(req: ScanRequest):
         SCANS[scan_id] = {"status": "queued", "results": None}
 
     def worker():
+        data_manager = None
         try:
             # mark as running
             with SCAN_LOCK:
@@ -112,7 +114,8 @@ def start_scan(req: ScanRequest):
                 total += t
                 pages_total += p
             # Find latest export files for first keyword as representative
-            json_files = sorted(glob.glob(str(Path(data_manager.data_dir) / f"search_{req.keywords[0]}_*.json")))
+            # Matches both .json (PRETTY_JSON) and .jsonl snapshots
+            json_files = sorted(glob.glob(str(Path(data_manager.data_dir) / f"search_{req.keywords[0]}_*.json*")))
             csv_files = sorted(glob.glob(str(Path(data_manager.data_dir) / f"search_{req.keywords[0]}_*.csv")))
             with SCAN_LOCK:
                 SCANS[scan_id] = {
@@ -124,6 +127,9 @@ def start_scan(req: ScanRequest):
         except Exception as e:
             with SCAN_LOCK:
                 SCANS[scan_id] = {"status": "error", "error": str(e)}
+        finally:
+            if data_manager is not None:
+                data_manager.close()
 
     threading.Thread(target=worker, daemon=True).start()
     return {"scan_id": scan_id}
@@ -146,6 +152,8 @@ def scan_results(scan_id: str):
     p = rec["json_path"]
     try:
         with open(p, 'r', encoding='utf-8') as f:
+            if p.endswith('.jsonl'):
+                return JSONResponse(content=[__import__('json').loads(line) for line in f if line.strip()])
             return JSONResponse(content=__import__('json').load(f))
     except Exception as e:
         return JSONResponse({"status": "error", "error": str(e)}, status_code=500)
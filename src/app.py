@@ -82,6 +82,7 @@ def search_keywords(keywords: List[str], use_selenium: bool = False, max_pages:
         print(f"Error: {e}")
     finally:
         scraper.close()
+        data_manager.close()
 
 def get_product_details(urls: List[str], use_selenium: bool = False):
     """Get detailed information for specific product URLs"""
@@ -131,6 +132,7 @@ def get_product_details(urls: List[str], use_selenium: bool = False):
         print(f"Error: {e}")
     finally:
         scraper.close()
+        data_manager.close()
 
 def get_company_profile(url: str, use_selenium: bool = False):
     """Get detailed company profile information including contact details"""
@@ -193,6 +195,7 @@ def get_company_profile(url: str, use_selenium: bool = False):
         print(f"Error: {e}")
     finally:
         scraper.close()
+        data_manager.close()
 
 def export_data(keyword: str, format_type: str = "json"):
     """Export data for a specific keyword"""
@@ -358,6 +361,7 @@ def analyze_certificates(url: str, use_selenium: bool = False):
         print(f"Error: {e}")
     finally:
         scraper.close()
+        data_manager.close()
 
 def main():
     """Main application entry point"""
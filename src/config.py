@@ -41,6 +41,8 @@ DATABASE_PATH = os.path.join(DATA_DIR, os.getenv("DATABASE_FILENAME", "made_in_c
 
 # Export settings
 EXPORT_FORMATS = ["json", "csv"]
+# Search snapshots are written as JSON Lines by default; set PRETTY_JSON=1 for an indented JSON array
+PRETTY_JSON = os.getenv("PRETTY_JSON", "0").lower() in ("1", "true", "yes")
 
 # Rate limiting (overridable via env) - lowered default for faster dev runs
 REQUEST_DELAY = int(os.getenv("REQUEST_DELAY", "1"))
@@ -1,21 +1,24 @@
 import json
 import csv
 import sqlite3
+import orjson
 import pandas as pd
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import os
 from loguru import logger
 
-from src.config import DATA_DIR, HISTORY_DIR, DATABASE_PATH, EXPORT_FORMATS
+from src.config import DATA_DIR, HISTORY_DIR, DATABASE_PATH, EXPORT_FORMATS, PRETTY_JSON
 from src.models import ProductListing, SearchResult, HistoryEntry
 
 class DataManager:
     """Manages data storage, history tracking, and exports"""
     
-    def __init__(self):
+    def __init__(self, pretty_json: bool = PRETTY_JSON):
         self.db_path = DATABASE_PATH
+        self.pretty_json = pretty_json
         self.history_dir = Path(HISTORY_DIR)
         self.data_dir = Path(DATA_DIR)
         
@@ -23,9 +26,16 @@ class DataManager:
         self.history_dir.mkdir(exist_ok=True)
         self.data_dir.mkdir(exist_ok=True)
         
+        # JSON and CSV snapshots are independent files; write them concurrently
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="data-io")
+        
         # Initialize database
         self._init_database()
     
+    def close(self):
+        """Release the file-writer threads"""
+        self._io_pool.shutdown(wait=True)
+    
     def _init_database(self):
         """Initialize SQLite database with required tables"""
         try:
@@ -45,7 +55,7 @@ class DataManager:
                         min_order_quantity INTEGER,
                         max_order_quantity INTEGER,
                         description TEXT,
-                        specifications TEXT,
+                        specifications BLOB,
                         scraped_at TIMESTAMP,
                         last_updated TIMESTAMP
                     )
@@ -104,23 +114,96 @@ class DataManager:
                     )
                 ''')
                 
+                # Create company_profiles table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS company_profiles (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        company_name TEXT,
+                        contact_person TEXT,
+                        email TEXT,
+                        phone TEXT,
+                        address TEXT,
+                        business_type TEXT,
+                        year_established TEXT,
+                        main_products TEXT,
+                        certificates TEXT,
+                        profile_url TEXT UNIQUE,
+                        scraped_at TIMESTAMP
+                    )
+                ''')
+                
+                # Full-text index over product title/description for keyword exports
+                self._init_products_fts(cursor)
+                
                 conn.commit()
                 logger.info("Database initialized successfully")
                 
         except Exception as e:
             logger.error(f"Error initializing database: {e}")
     
+    def _init_products_fts(self, cursor):
+        """Create the products_fts index and its sync triggers (no-op if FTS5/trigram is unavailable)
+        
+        The trigram tokenizer keeps the substring semantics of the LIKE scan it replaces.
+        """
+        try:
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'products_fts'")
+            row = cursor.fetchone()
+            exists = row is not None
+            if exists and 'trigram' not in row[0]:
+                # Index from an older build with word tokens: rebuild it as trigrams
+                for trigger in ('products_fts_ai', 'products_fts_ad', 'products_fts_au'):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                cursor.execute("DROP TABLE products_fts")
+                exists = False
+            
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS products_fts
+                USING fts5(title, description, content='products', content_rowid='id', tokenize='trigram')
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+                    INSERT INTO products_fts (rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+                    INSERT INTO products_fts (products_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE ON products BEGIN
+                    INSERT INTO products_fts (products_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                    INSERT INTO products_fts (rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END
+            ''')
+            
+            # Index rows that were stored before the FTS table existed
+            if not exists:
+                cursor.execute("INSERT INTO products_fts (products_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, keyword exports will use LIKE scans: {e}")
+    
+    @staticmethod
+    def _fts_query(keyword: str) -> str:
+        """Build an FTS5 MATCH expression matching ``keyword`` as a substring (trigram phrase)"""
+        return '"' + keyword.replace('"', '""') + '"'
+    
     def save_search_result(self, search_result: SearchResult):
         """Save search results to database and files"""
         try:
             # Save to database
             self._save_search_result_to_db(search_result)
             
-            # Save to JSON file
-            self._save_search_result_to_json(search_result)
-            
-            # Save to CSV file
-            self._save_search_result_to_csv(search_result)
+            # Save to JSON and CSV files in parallel
+            json_future = self._io_pool.submit(self._save_search_result_to_json, search_result)
+            csv_future = self._io_pool.submit(self._save_search_result_to_csv, search_result)
+            for future in (json_future, csv_future):
+                future.result()
             
             logger.info(f"Saved search results for keyword: {search_result.keyword}")
             
@@ -143,13 +226,14 @@ class DataManager:
                 search_result.scraped_at.isoformat()
             ))
             
-            # Save each product listing
+            # Save each product listing (one timestamp for the whole batch)
+            now_iso = datetime.now().isoformat()
             for listing in search_result.listings:
-                self._save_product_listing_to_db(listing, cursor)
+                self._save_product_listing_to_db(listing, cursor, now_iso)
             
             conn.commit()
     
-    def _save_product_listing_to_db(self, listing: ProductListing, cursor):
+    def _save_product_listing_to_db(self, listing: ProductListing, cursor, now_iso: Optional[str] = None):
         """Save a product listing to database"""
         try:
             # Check if product already exists
@@ -158,7 +242,7 @@ class DataManager:
             
             if existing:
                 # Update existing product
-                self._update_product_in_db(listing, cursor)
+                self._update_product_in_db(listing, cursor, now_iso)
             else:
                 # Insert new product
                 self._insert_product_to_db(listing, cursor)
@@ -184,7 +268,7 @@ class DataManager:
             listing.min_order_quantity,
             listing.max_order_quantity,
             listing.description,
-            json.dumps(listing.specifications) if listing.specifications else None,
+            orjson.dumps(listing.specifications) if listing.specifications else None,
             listing.scraped_at.isoformat(),
             listing.last_updated.isoformat() if listing.last_updated else None
         ))
@@ -198,8 +282,10 @@ class DataManager:
                 VALUES (?, ?, ?, ?)
             ''', (product_id, image.url, image.alt_text, image.caption))
     
-    def _update_product_in_db(self, listing: ProductListing, cursor):
+    def _update_product_in_db(self, listing: ProductListing, cursor, now_iso: Optional[str] = None):
         """Update existing product in database and track changes"""
+        now_iso = now_iso or datetime.now().isoformat()
+        
         # Get current values
         cursor.execute('''
             SELECT * FROM products WHERE item_number = ?
@@ -210,7 +296,7 @@ class DataManager:
             return
         
         # Compare and track changes
-        self._track_changes(listing, current, cursor)
+        self._track_changes(listing, current, cursor, now_iso)
         
         # Update product
         cursor.execute('''
@@ -228,13 +314,14 @@ class DataManager:
             listing.min_order_quantity,
             listing.max_order_quantity,
             listing.description,
-            json.dumps(listing.specifications) if listing.specifications else None,
-            datetime.now().isoformat(),
+            orjson.dumps(listing.specifications) if listing.specifications else None,
+            now_iso,
             listing.item_number
         ))
     
-    def _track_changes(self, new_listing: ProductListing, old_data, cursor):
+    def _track_changes(self, new_listing: ProductListing, old_data, cursor, now_iso: Optional[str] = None):
         """Track changes between old and new data"""
+        now_iso = now_iso or datetime.now().isoformat()
         # Align to current products schema: id(0), item_number(1), title(2), listing_url(3), sku(4),
         # price(5), currency(6), min_order_quantity(7), max_order_quantity(8), description(9),
         # specifications(10), scraped_at(11), last_updated(12)
@@ -262,20 +349,30 @@ class DataManager:
                     field_name,
                     str(old_value) if old_value is not None else None,
                     str(new_value) if new_value is not None else None,
-                    datetime.now().isoformat()
+                    now_iso
                 ))
     
     # Removed unused _save_seller_to_db; seller info is not persisted in current schema
     
     def _save_search_result_to_json(self, search_result: SearchResult):
-        """Save search result to JSON file in standardized marketplace schema"""
+        """Save search result in standardized marketplace schema.
+        
+        Writes JSON Lines (one row per line) by default; an indented JSON array when pretty_json is set.
+        """
         timestamp = search_result.scraped_at.strftime("%Y%m%d_%H%M%S")
         filename = f"search_{search_result.keyword}_{timestamp}.json"
         filepath = self.data_dir / filename
         
-        rows = [self._listing_to_marketplace_row(listing) for listing in search_result.listings]
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(rows, f, indent=2, ensure_ascii=False)
+        if self.pretty_json:
+            rows = [self._listing_to_marketplace_row(listing) for listing in search_result.listings]
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(rows, f, indent=2, ensure_ascii=False)
+        else:
+            filepath = filepath.with_suffix('.jsonl')
+            with open(filepath, 'wb', buffering=65536) as f:
+                for listing in search_result.listings:
+                    f.write(orjson.dumps(self._listing_to_marketplace_row(listing)))
+                    f.write(b'\n')
         
         logger.info(f"Saved JSON file: {filepath}")
     
@@ -447,13 +544,27 @@ class DataManager:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT *
-                    FROM products
-                    WHERE title LIKE ? OR description LIKE ?
-                ''', (f"%{keyword}%", f"%{keyword}%"))
-                
-                rows = cursor.fetchall()
+                rows = None
+                # Trigrams can't match fewer than 3 characters (an empty keyword exports everything)
+                if len(keyword) >= 3:
+                    try:
+                        cursor.execute('''
+                            SELECT p.*
+                            FROM products p
+                            JOIN products_fts f ON f.rowid = p.id
+                            WHERE products_fts MATCH ?
+                        ''', (self._fts_query(keyword),))
+                        rows = cursor.fetchall()
+                    except sqlite3.OperationalError:
+                        # FTS5/trigram unavailable: fall back to a full scan
+                        pass
+                if rows is None:
+                    cursor.execute('''
+                        SELECT *
+                        FROM products
+                        WHERE title LIKE ? OR description LIKE ?
+                    ''', (f"%{keyword}%", f"%{keyword}%"))
+                    rows = cursor.fetchall()
                 
                 if not rows:
                     logger.warning(f"No data found for keyword: {keyword}")
@@ -472,7 +583,8 @@ class DataManager:
                         'min_order_quantity': row[7],
                         'max_order_quantity': row[8],
                         'description': row[9],
-                        'specifications': row[10],
+                        # Stored as orjson bytes (older rows may still hold TEXT)
+                        'specifications': row[10].decode('utf-8') if isinstance(row[10], bytes) else row[10],
                         'scraped_at': row[11],
                         'last_updated': row[12]
                     })
@@ -505,9 +617,12 @@ class DataManager:
         filename = f"export_{keyword}_{timestamp}.csv"
         filepath = self.data_dir / filename
         
-        df = pd.DataFrame(data)
-        df.to_csv(filepath, index=False, encoding='utf-8')
-        
+        # Plain csv writer: no need to materialize a DataFrame just to serialize rows
+        with open(filepath, 'w', encoding='utf-8', newline='', buffering=65536) as f:
+            writer = csv.DictWriter(f, fieldnames=list(data[0].keys()))
+            writer.writeheader()
+            writer.writerows(data)
+
         logger.info(f"Exported CSV file: {filepath}")
         return str(filepath)
     
@@ -517,25 +632,18 @@ class DataManager:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                # Get counts
-                cursor.execute('SELECT COUNT(*) FROM products')
-                total_products = cursor.fetchone()[0]
-                
-                cursor.execute('SELECT COUNT(*) FROM sellers')
-                total_sellers = cursor.fetchone()[0]
-                
-                cursor.execute('SELECT COUNT(*) FROM search_results')
-                total_searches = cursor.fetchone()[0]
-                
-                cursor.execute('SELECT COUNT(*) FROM history')
-                total_changes = cursor.fetchone()[0]
-                
-                # Get recent activity
+                # Get counts and recent activity in a single statement
                 cursor.execute('''
-                    SELECT COUNT(*) FROM products 
-                    WHERE scraped_at >= datetime('now', '-7 days')
+                    SELECT
+                        (SELECT COUNT(*) FROM products),
+                        (SELECT COUNT(*) FROM sellers),
+                        (SELECT COUNT(*) FROM search_results),
+                        (SELECT COUNT(*) FROM history),
+                        (SELECT COUNT(*) FROM products
+                         WHERE scraped_at >= datetime('now', '-7 days'))
                 ''')
-                recent_products = cursor.fetchone()[0]
+                (total_products, total_sellers, total_searches,
+                 total_changes, recent_products) = cursor.fetchone()
                 
                 return {
                     'total_products': total_products,
@@ -610,6 +718,7 @@ class DataManager:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
+                now_iso = datetime.now().isoformat()
                 
                 # Update product information
                 cursor.execute('''
@@ -620,7 +729,7 @@ class DataManager:
                 ''', (
                     listing.title, listing.listing_url, listing.sku, listing.price,
                     listing.currency, listing.min_order_quantity, listing.max_order_quantity,
-                    listing.description, datetime.now().isoformat(), listing.item_number
+                    listing.description, now_iso, listing.item_number
                 ))
                 
                 # Update seller information if exists
@@ -652,24 +761,6 @@ class DataManager:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                # Create company_profiles table if it doesn't exist
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS company_profiles (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        company_name TEXT,
-                        contact_person TEXT,
-                        email TEXT,
-                        phone TEXT,
-                        address TEXT,
-                        business_type TEXT,
-                        year_established TEXT,
-                        main_products TEXT,
-                        certificates TEXT,
-                        profile_url TEXT UNIQUE,
-                        scraped_at TIMESTAMP
-                    )
-                ''')
-                
                 # Insert or update company profile
                 cursor.execute('''
                     INSERT OR REPLACE INTO company_profiles 
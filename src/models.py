@@ -1,16 +1,27 @@
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-import json
+import orjson
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _shallow_dict(obj) -> Dict[str, Any]:
+    """Field-name -> value dict for a slotted dataclass (no __dict__, no deepcopy)."""
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+@dataclass(slots=True)
 class ProductImage:
     """Represents a product image"""
     url: str
     alt_text: Optional[str] = None
     caption: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Seller:
     """Represents a seller on Made-in-China"""
     name: str
@@ -28,7 +39,7 @@ class Seller:
     verified: Optional[bool] = None
     member_since: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ProductListing:
     """Represents a product listing on Made-in-China"""
     # Basic listing info
@@ -69,18 +80,31 @@ class ProductListing:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        data['seller'] = asdict(self.seller) if self.seller else None
-        data['images'] = [asdict(img) for img in self.images]
-        data['scraped_at'] = self.scraped_at.isoformat()
-        data['last_updated'] = self.last_updated.isoformat() if self.last_updated else None
-        return data
+        # Shallow, explicit build: asdict() deep-copies every nested value
+        return {
+            'title': self.title,
+            'listing_url': self.listing_url,
+            'item_number': self.item_number,
+            'sku': self.sku,
+            'price': self.price,
+            'currency': self.currency,
+            'min_order_quantity': self.min_order_quantity,
+            'max_order_quantity': self.max_order_quantity,
+            'brand': self.brand,
+            'units_available': self.units_available,
+            'description': self.description,
+            'specifications': dict(self.specifications) if self.specifications is not None else None,
+            'images': [_shallow_dict(img) for img in self.images],
+            'seller': _shallow_dict(self.seller) if self.seller else None,
+            'scraped_at': self.scraped_at.isoformat(),
+            'last_updated': self.last_updated.isoformat() if self.last_updated else None,
+        }
 
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Represents search results for a keyword"""
     keyword: str
@@ -105,9 +129,9 @@ class SearchResult:
 
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
 
-@dataclass
+@dataclass(slots=True)
 class HistoryEntry:
     """Represents a history entry for tracking changes"""
     item_number: str
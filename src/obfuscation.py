@@ -1,28 +1,31 @@
 import re
 
 
+# Compiled once at import; decode_obfuscated runs for every scraped text blob.
+# A single alternation decodes both [at] and [dot] forms in one scan of the text.
+_OBF_RE = re.compile(
+    r"\s*\[?\s*(?P<at>at|AT|＠|\(at\))\s*\]?\s*"
+    r"|\s*\[?\s*(?P<dot>dot|DOT|。|\(dot\))\s*\]?\s*"
+)
+_AT_SPACES_RE = re.compile(r"([\w.%+-])\s+(@)\s+([\w.-])")
+_DOMAIN_SPACES_RE = re.compile(r"(@)\s+([\w.-]+)\s*(\.)\s*([A-Za-z]{2,})")
+_EMAIL_RE = re.compile(r"\b[\w.%+-]+@[\w.-]+\.[A-Za-z]{2,}\b")
+
+
 def decode_obfuscated(text: str) -> str:
     if not text:
         return text
     t = text
-    replacements = [
-        (r"\s*\[?\s*(?:at|AT|＠|\(at\))\s*\]?\s*", "@"),
-        (r"\s*\[?\s*(?:dot|DOT|。|\(dot\))\s*\]?\s*", "."),
-        (r"\s*\(at\)\s*", "@"),
-        (r"\s*\(dot\)\s*", "."),
-    ]
-    for pat, repl in replacements:
-        t = re.sub(pat, repl, t)
+    t = _OBF_RE.sub(lambda m: "@" if m.lastgroup == "at" else ".", t)
     # remove spaces inside email-like strings
-    t = re.sub(r"([\w.%+-])\s+(@)\s+([\w.-])", r"\1\2\3", t)
-    t = re.sub(r"(@)\s+([\w.-]+)\s*(\.)\s*([A-Za-z]{2,})", r"\1\2\3\4", t)
+    t = _AT_SPACES_RE.sub(r"\1\2\3", t)
+    t = _DOMAIN_SPACES_RE.sub(r"\1\2\3\4", t)
     return t
 
 
 def extract_emails_with_obfuscation(text: str) -> list[str]:
     t = decode_obfuscated(text)
-    pattern = re.compile(r"\b[\w.%+-]+@[\w.-]+\.[A-Za-z]{2,}\b")
-    return pattern.findall(t)
+    return _EMAIL_RE.findall(t)
 
 
 
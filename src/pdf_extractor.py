@@ -1,23 +1,194 @@
+import copy
 import io
 import re
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 from loguru import logger
 
 from src.config import HEADERS, DATA_DIR
 import os
 import hashlib
 
+# Tesseract's internal OpenMP threading contends with our own worker threads; run each
+# OCR call single-threaded and parallelise across images instead. Must be set before
+# libtesseract (tesserocr) loads or pytesseract spawns its subprocess.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+# Default session shared by every PDFExtractor built without one, so keep-alive
+# connections (and their TLS handshakes) are reused across instances.
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.headers.update(HEADERS)
+_shared_adapter = HTTPAdapter(
+    pool_connections=64,
+    pool_maxsize=64,
+    # Connection-level retries only: without a status_forcelist urllib3 would still retry
+    # 413/429/503 carrying Retry-After (uncapped), so that is switched off too. Status codes are
+    # retried by _get_with_backoff (UA rotation, capped Retry-After).
+    max_retries=Retry(total=3, backoff_factor=0.3, respect_retry_after_header=False),
+)
+_SHARED_SESSION.mount("https://", _shared_adapter)
+_SHARED_SESSION.mount("http://", _shared_adapter)
+
+# Upper bound on any single certificate/page download
+_MAX_DOWNLOAD_BYTES = 25 * 1024 * 1024
+# Landing pages are only scanned for links; anything bigger is not a certificate page
+_MAX_HTML_BYTES = 5 * 1024 * 1024
+
+
+class _ResponseTooLarge(ValueError):
+    """Body exceeded the download cap; permanent, so not worth retrying."""
+
+
+# Email scans run over whole PDF/OCR text; prefer RE2 (linear-time DFA) when installed
+try:
+    import re2 as _email_re_engine  # type: ignore
+except ImportError:
+    _email_re_engine = re
+_EMAIL_RE = _email_re_engine.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+# URL shape heuristics used by _absolutize
+_BARE_DOMAIN_RE = re.compile(r'^[A-Za-z0-9.-]+\.[A-Za-z]{2,}($|/|\?)')
+_DOUBLE_HOST_RE = re.compile(r'^(https?://[^/]+)/(https?://.+)$')
+_HOST_IN_PATH_RE = re.compile(r'^(https?://[^/]+)/(www\.[^/]+/.+)$')
+# Global OCR binarization threshold as a 256-entry lookup table for Image.point
+_OCR_THRESHOLD = 180
+_OCR_BW_LUT = [255 if p > _OCR_THRESHOLD else 0 for p in range(256)]
+# PDFium keeps process-global state and is not thread-safe, even across documents. Every
+# pypdfium2 call (open, text, render, close) must hold this lock.
+_PDFIUM_LOCK = threading.Lock()
+# Resolution PDF pages are rendered at for QR detection; plenty for certificate-sized codes
+_QR_RENDER_DPI = 150
+_PSM_RE = re.compile(r"--psm\s+(\d+)")
+
+_clahe_local = threading.local()
+
+
+def _clahe(cv2):
+    # CLAHE objects are not safe to share between threads; keep one per OCR thread
+    clahe = getattr(_clahe_local, "clahe", None)
+    if clahe is None:
+        clahe = _clahe_local.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    return clahe
+
+
+# Process-wide memo of analyze_url results keyed on URL. Certificates are linked from many
+# listings of the same supplier, so repeat lookups skip the download/parse/OCR entirely.
+_ANALYSIS_CACHE_SIZE = 2048
+_analysis_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+# Emails/QR payloads per PDF body, keyed on the sha256 already computed while downloading.
+# The same certificate is often served under several URLs (CDN mirrors, signed links).
+_PDF_RESULT_CACHE_SIZE = 1024
+_pdf_result_cache: "OrderedDict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]" = OrderedDict()
+_pdf_result_cache_lock = threading.Lock()
+# Landing pages are only scanned for these tags; skip building the rest of the tree
+_CANDIDATE_STRAINER = SoupStrainer(["embed", "iframe", "a", "img"])
+
+
+def _has_scheme(ref: str) -> bool:
+    """Cheap equivalent of matching ``^[a-zA-Z][a-zA-Z0-9+.-]*://``."""
+    idx = ref.find("://", 0, 32)
+    if idx <= 0:
+        return False
+    scheme = ref[:idx]
+    return scheme.isascii() and scheme[0].isalpha() and scheme.replace("+", "").replace(".", "").replace("-", "").isalnum()
+
+
+# Texts at least this long are regex-scanned only around their '@' characters
+_AT_WINDOW_MIN_TEXT = 16 * 1024
+
+
+def _at_windows(text: str) -> List[str]:
+    """Slices of ``text`` around each '@', widened to whitespace and merged when overlapping.
+
+    An email match cannot span whitespace, so scanning these slices finds exactly the
+    matches a scan of the whole text would.
+    """
+    spans: List[List[int]] = []
+    n = len(text)
+    pos = text.find("@")
+    while pos != -1:
+        start = max(0, pos - 64)
+        while start > 0 and not text[start - 1].isspace():
+            start -= 1
+        end = min(n, pos + 256)
+        while end < n and not text[end].isspace():
+            end += 1
+        if spans and start <= spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+        pos = text.find("@", end)
+    return [text[a:b] for a, b in spans]
+
+
+@lru_cache(maxsize=1024)
+def _cached_urljoin(base_url: str, ref: str) -> str:
+    # The same relative hrefs recur across a site's pages
+    return urljoin(base_url, ref)
+
+
+def _absolutize(base_url: str, ref: str) -> str:
+    try:
+        if not ref:
+            return ref
+        # Already absolute
+        if _has_scheme(ref):
+            return ref
+        # Protocol-relative
+        if ref.startswith("//"):
+            return "https:" + ref
+        # Bare domain without scheme (e.g. image.made-in-china.com/path)
+        if _BARE_DOMAIN_RE.match(ref):
+            return "https://" + ref.lstrip('/')
+        # Otherwise, standard URL join
+        joined = _cached_urljoin(base_url if base_url.endswith('/') else base_url + '/', ref)
+        # The repair patterns below only apply when a second host ended up in the path,
+        # which a substring test rules out for almost every link
+        path = joined[joined.find("://") + 3:]
+        # Fix double host patterns like https://host/https://other/...
+        if "/http" in path:
+            m = _DOUBLE_HOST_RE.match(joined)
+            if m:
+                return m.group(2)
+        # Fix accidental host-in-path like https://host/www.micstatic.com/...
+        if "/www." in path:
+            host_in_path = _HOST_IN_PATH_RE.match(joined)
+            if host_in_path:
+                return "https://" + host_in_path.group(2)
+        return joined
+    except Exception:  # noqa: BLE001
+        return ref
+
 
 class PDFExtractor:
     """Utility for fetching PDFs and extracting emails/text with graceful fallbacks."""
 
     def __init__(self, session: Optional[requests.Session] = None, request_timeout_seconds: int = 20):
-        self.session = session or requests.Session()
-        self.session.headers.update(HEADERS)
+        if session is None:
+            self.session = _SHARED_SESSION
+        else:
+            # Fetch through our own adapter: the caller's may retry 429/5xx itself (the scraper's
+            # does), which would hide them from _get_with_backoff's capped Retry-After handling.
+            # Headers and cookies still come from the caller's session.
+            self.session = requests.Session()
+            self.session.headers.update(session.headers)
+            self.session.headers.update(HEADERS)
+            self.session.cookies = session.cookies
+            self.session.mount("https://", _shared_adapter)
+            self.session.mount("http://", _shared_adapter)
         self.request_timeout_seconds = request_timeout_seconds
         self._user_agents = [
             HEADERS.get('User-Agent', ''),
@@ -26,26 +197,58 @@ class PDFExtractor:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123 Safari/537.36'
         ]
         self._ua_index = 0
+        # Set once a request has been rotated away from the session's UA; sent per request so the
+        # shared session's headers (used by other instances and threads) are never mutated
+        self._user_agent: Optional[str] = None
+        # Embedded PDF/image candidates are fetched concurrently
+        self._fetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pdf-fetch")
+        # In-process Tesseract (tesserocr). An API instance is not thread-safe, so each OCR thread
+        # gets its own, created on first use; None = not tried, False = tesserocr unavailable
+        self._tess_available: Optional[bool] = None
+        self._tess_local = threading.local()
+        self._tess_apis: List = []
+        self._tess_lock = threading.Lock()
+        self._assets_dir = os.path.join(DATA_DIR, "assets")
+        os.makedirs(self._assets_dir, exist_ok=True)
+
+    def close(self) -> None:
+        # Wait for running fetches so no thread is mid-OCR when its API is ended
+        self._fetch_pool.shutdown(wait=True, cancel_futures=True)
+        with self._tess_lock:
+            apis, self._tess_apis = self._tess_apis, []
+        for api in apis:
+            api.End()
+        self._tess_local = threading.local()
 
     def _rotate_user_agent(self) -> None:
         self._ua_index = (self._ua_index + 1) % len(self._user_agents)
-        self.session.headers['User-Agent'] = self._user_agents[self._ua_index]
+        self._user_agent = self._user_agents[self._ua_index]
 
-    def _get_with_backoff(self, url: str, max_retries: int = 4) -> requests.Response:
+    def _get_with_backoff(self, url: str, max_retries: int = 4, stream: bool = False) -> requests.Response:
         delay = 1.0
         last_exc: Optional[Exception] = None
         for attempt in range(max_retries):
             try:
-                resp = self.session.get(url, timeout=self.request_timeout_seconds, allow_redirects=True)
+                headers = {'User-Agent': self._user_agent} if self._user_agent else None
+                resp = self.session.get(url, headers=headers, timeout=self.request_timeout_seconds, allow_redirects=True, stream=stream)
                 # Rotate UA on 429/493/5xx
                 if resp.status_code in (429, 493) or 500 <= resp.status_code < 600:
+                    resp.close()
                     self._rotate_user_agent()
-                    time.sleep(delay)
+                    # Honour the server's Retry-After (seconds form) when given
+                    retry_after = resp.headers.get("retry-after", "")
+                    time.sleep(min(float(retry_after), 30.0) if retry_after.isdigit() else delay)
                     delay = min(delay * 2, 8)
                     last_exc = Exception(f"HTTP {resp.status_code}")
                     continue
-                resp.raise_for_status()
+                # Any other 4xx is permanent (raised below without a retry)
+                if resp.status_code >= 400:
+                    # Release the streamed connection before raising; nothing will read this body
+                    resp.close()
+                    resp.raise_for_status()
                 return resp
+            except requests.HTTPError:
+                raise
             except Exception as e:  # noqa: BLE001
                 last_exc = e
                 self._rotate_user_agent()
@@ -53,13 +256,75 @@ class PDFExtractor:
                 delay = min(delay * 2, 8)
         raise last_exc or Exception('request failed')
 
+    @staticmethod
+    def _sniff_kind(head: bytes) -> Optional[str]:
+        """Classify a body by its leading magic bytes: "pdf", "image" or None."""
+        if head.startswith(b"%PDF-"):
+            return "pdf"
+        if head[:3] in (b"\xff\xd8\xff", b"\x89PN", b"GIF"):
+            return "image"
+        return None
+
+    @staticmethod
+    def _read_capped(
+        resp: requests.Response,
+        max_bytes: int = _MAX_DOWNLOAD_BYTES,
+        cap_for_head: Optional[Callable[[bytes], int]] = None,
+    ) -> Tuple[bytes, str]:
+        """Read a streamed response body, refusing anything larger than ``max_bytes``.
+
+        Returns ``(content, sha256 hexdigest)``; the hash is updated chunk by chunk as the body
+        arrives so assets never need a second pass. ``cap_for_head`` may lower the cap once the
+        first chunk (and its magic bytes) is known.
+        """
+        try:
+            length = resp.headers.get("content-length")
+            if length and length.isdigit() and int(length) > max_bytes:
+                raise _ResponseTooLarge(f"Response too large ({length} bytes): {resp.url}")
+            chunks: List[bytes] = []
+            total = 0
+            digest = hashlib.sha256()
+            for chunk in resp.iter_content(65536):
+                if cap_for_head is not None and not chunks:
+                    max_bytes = cap_for_head(chunk)
+                total += len(chunk)
+                if total > max_bytes:
+                    raise _ResponseTooLarge(f"Response exceeded {max_bytes} bytes: {resp.url}")
+                chunks.append(chunk)
+                digest.update(chunk)
+            return b"".join(chunks), digest.hexdigest()
+        finally:
+            resp.close()
+
     def analyze_url(self, url: str, display_name: Optional[str] = None) -> Dict:
         """Download a certificate (PDF or landing page), extract emails, and return analysis details.
 
+        Results (including "no emails found") are cached per URL. Failed requests are not, nor are
+        landing pages where a candidate PDF/image fetch or its OCR raised, since a retry may succeed.
         Returns a dict: { name, type, url, emails, error }
         """
+        name = display_name or self._infer_name_from_url(url)
+        with _analysis_cache_lock:
+            cached = _analysis_cache.get(url)
+            if cached is not None:
+                _analysis_cache.move_to_end(url)
+        if cached is not None:
+            result = copy.deepcopy(cached)
+            result["name"] = name
+            return result
+
+        result, complete = self._analyze_url_uncached(url, name)
+        if complete and not result.get("error"):
+            with _analysis_cache_lock:
+                _analysis_cache[url] = copy.deepcopy(result)
+                if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                    _analysis_cache.popitem(last=False)
+        return result
+
+    def _analyze_url_uncached(self, url: str, name: str) -> Tuple[Dict, bool]:
+        """Return ``(result, complete)``; ``complete`` is False when a candidate fetch failed."""
         result: Dict = {
-            "name": display_name or self._infer_name_from_url(url),
+            "name": name,
             "type": "PDF",
             "url": url,
             "emails": [],
@@ -67,331 +332,486 @@ class PDFExtractor:
         }
 
         try:
-            # First attempt: direct GET
-            response = self._get_with_backoff(url)
+            # First attempt: direct GET. The body is streamed, so the response headers act as a
+            # probe: the type is known before the body is read and HTML gets a tighter cap.
+            response = self._get_with_backoff(url, stream=True)
             content_type = response.headers.get("content-type", "").lower()
-
-            if "application/pdf" in content_type or url.lower().endswith(".pdf"):
-                text = self._extract_text_from_pdf_bytes(response.content)
-                emails = self._extract_emails_from_text(text) if text else []
-                # QR scan within PDF images
-                qr_payloads = self._extract_qr_payloads_from_pdf_bytes(response.content)
-                if qr_payloads:
-                    # Extract any emails present in QR payloads
-                    for payload in qr_payloads:
-                        qr_emails = self._extract_emails_from_text(payload)
-                        for e in qr_emails:
-                            if e not in emails:
-                                emails.append(e)
-                sha, saved_path = self._persist_asset(response.content, suggested_ext=".pdf")
+            lower_url = url.lower()
+            declared_pdf = "application/pdf" in content_type or lower_url.endswith(".pdf")
+            declared_image = content_type.startswith("image/") or any(lower_url.endswith(ext) for ext in (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff"))
+
+            def cap_for_head(head: bytes) -> int:
+                if declared_pdf or declared_image or self._sniff_kind(head):
+                    return _MAX_DOWNLOAD_BYTES
+                return _MAX_HTML_BYTES
+
+            content, sha = self._read_capped(response, cap_for_head=cap_for_head)
+            # Magic bytes win over content-type/suffix (servers often mislabel PDFs);
+            # the declared type only decides for formats without a sniffed signature
+            kind = self._sniff_kind(content[:8])
+            is_pdf = kind == "pdf" or (kind is None and declared_pdf)
+            is_image = kind == "image" or (kind is None and declared_image and not declared_pdf)
+
+            if is_pdf:
+                emails, qr_payloads = self._analyze_pdf_content(content, sha)
+                saved_path = self._persist_asset(content, sha, suggested_ext=".pdf")
                 result.update({
                     "emails": emails,
                     "sha256": sha,
                     "content_type": content_type,
-                    "size_bytes": len(response.content),
+                    "size_bytes": len(content),
                     "saved_path": saved_path,
                 })
                 if qr_payloads:
                     result["qr_payloads"] = qr_payloads
-                return result
+                return result, True
 
             # Handle images (OCR)
-            if content_type.startswith("image/") or any(url.lower().endswith(ext) for ext in (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff")):
-                text = self._extract_text_from_image_bytes(response.content)
+            if is_image:
+                text = self._extract_text_from_image_bytes(content)
                 emails = self._extract_emails_from_text(text) if text else []
-                sha, saved_path = self._persist_asset(response.content, suggested_ext=self._guess_ext_from_ct(content_type) or ".img")
+                saved_path = self._persist_asset(content, sha, suggested_ext=self._guess_ext_from_ct(content_type) or ".img")
                 result["type"] = "IMAGE"
                 result.update({
                     "emails": emails,
                     "sha256": sha,
                     "content_type": content_type,
-                    "size_bytes": len(response.content),
+                    "size_bytes": len(content),
                     "saved_path": saved_path,
                 })
-                return result
+                return result, True
 
             # Fallback: page may contain embedded PDF or links
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Try <embed type="application/pdf"> or iframe with .pdf
-            pdf_srcs: List[str] = []
-            embed = soup.find("embed", attrs={"type": "application/pdf"})
-            if embed and embed.get("src"):
-                pdf_srcs.append(embed.get("src"))
-
-            for iframe in soup.find_all("iframe"):
-                src = iframe.get("src") or ""
-                if ".pdf" in src.lower():
-                    pdf_srcs.append(src)
-
-            # Also collect anchor links that point to pdfs
-            for a in soup.find_all("a"):
-                href = a.get("href") or ""
-                if ".pdf" in href.lower():
-                    pdf_srcs.append(href)
-
-            # Collect likely certificate images to OCR
+            soup = BeautifulSoup(content, "lxml", parse_only=_CANDIDATE_STRAINER)
+
+            # Single traversal over all candidate tags, dispatching on tag name.
+            # PDF candidates keep their priority: <embed>, then <iframe>, then <a>.
+            embed_srcs: List[str] = []
+            iframe_srcs: List[str] = []
+            anchor_srcs: List[str] = []
             img_srcs: List[str] = []
-            for img in soup.find_all("img"):
-                src = img.get("src") or ""
-                alt = (img.get("alt") or "").lower()
-                if any(k in alt for k in ("certificate", "cert", "cb", "ce", "gs")) or any(src.lower().endswith(ext) for ext in (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")):
-                    img_srcs.append(src)
+            for tag in soup.select("embed[type='application/pdf'][src], iframe[src], a[href], img[src]"):
+                tag_name = tag.name
+                if tag_name == "a":
+                    href = tag.get("href") or ""
+                    if ".pdf" in href.lower():
+                        anchor_srcs.append(href)
+                elif tag_name == "img":
+                    # Collect likely certificate images to OCR
+                    src = tag.get("src") or ""
+                    alt = (tag.get("alt") or "").lower()
+                    if any(k in alt for k in ("certificate", "cert", "cb", "ce", "gs")) or any(src.lower().endswith(ext) for ext in (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")):
+                        img_srcs.append(src)
+                elif tag_name == "iframe":
+                    src = tag.get("src") or ""
+                    if ".pdf" in src.lower():
+                        iframe_srcs.append(src)
+                elif tag_name == "embed" and not embed_srcs:
+                    embed_srcs.append(tag.get("src"))
+            pdf_srcs: List[str] = embed_srcs + iframe_srcs + anchor_srcs
 
             # Deduplicate while preserving order
-            seen = set()
-            unique_pdf_srcs: List[str] = []
-            for src in pdf_srcs:
-                if not src:
-                    continue
-                abs_src = self._absolutize(url, src)
-                if abs_src not in seen:
-                    seen.add(abs_src)
-                    unique_pdf_srcs.append(abs_src)
+            unique_pdf_srcs: List[str] = list(dict.fromkeys(_absolutize(url, src) for src in pdf_srcs if src))
 
-            for pdf_url in unique_pdf_srcs[:3]:  # limit attempts
-                try:
-                    pdf_resp = self._get_with_backoff(pdf_url)
-                    text = self._extract_text_from_pdf_bytes(pdf_resp.content)
-                    emails = self._extract_emails_from_text(text) if text else []
-                    if emails:
-                        sha, saved_path = self._persist_asset(pdf_resp.content, suggested_ext=".pdf")
-                        result.update({
-                            "emails": emails,
-                            "url": pdf_url,
-                            "sha256": sha,
-                            "content_type": pdf_resp.headers.get("content-type", ""),
-                            "size_bytes": len(pdf_resp.content),
-                            "saved_path": saved_path,
-                        })
-                        return result
-                    time.sleep(1)
-                except Exception as inner_err:  # noqa: BLE001
-                    logger.debug(f"Error fetching embedded PDF {pdf_url}: {inner_err}")
+            # Fetch the top candidates concurrently; the first one yielding emails wins
+            hit, pdf_failed = self._first_hit(self._try_pdf_candidate, unique_pdf_srcs[:3])  # limit attempts
+            if hit:
+                result.update(hit)
+                return result, True
 
             # OCR top N images if present
-            seen_img = set()
-            unique_img_srcs: List[str] = []
-            for src in img_srcs:
-                if not src:
-                    continue
-                abs_src = self._absolutize(url, src)
-                if abs_src not in seen_img:
-                    seen_img.add(abs_src)
-                    unique_img_srcs.append(abs_src)
+            unique_img_srcs: List[str] = list(dict.fromkeys(_absolutize(url, src) for src in img_srcs if src))
 
-            for img_url in unique_img_srcs[:3]:
-                try:
-                    img_resp = self._get_with_backoff(img_url)
-                    text = self._extract_text_from_image_bytes(img_resp.content)
-                    emails = self._extract_emails_from_text(text) if text else []
-                    if emails:
-                        sha, saved_path = self._persist_asset(img_resp.content, suggested_ext=self._guess_ext_from_ct(img_resp.headers.get("content-type", "")) or ".img")
-                        result["type"] = "IMAGE"
-                        result.update({
-                            "emails": emails,
-                            "url": img_url,
-                            "sha256": sha,
-                            "content_type": img_resp.headers.get("content-type", ""),
-                            "size_bytes": len(img_resp.content),
-                            "saved_path": saved_path,
-                        })
-                        return result
-                    time.sleep(1)
-                except Exception as inner_err:  # noqa: BLE001
-                    logger.debug(f"Error OCR image {img_url}: {inner_err}")
+            hit, img_failed = self._first_hit(self._try_image_candidate, unique_img_srcs[:3])
+            if hit:
+                result["type"] = "IMAGE"
+                result.update(hit)
+                return result, True
 
             # Last resort: try to find emails directly on the landing page text
-            page_text = soup.get_text(separator=" ", strip=True)
-            result["emails"] = self._extract_emails_from_text(page_text)
-            return result
+            # (needs the full document, not just the strained candidate tags)
+            if content.strip():
+                root = lxml.html.fromstring(content)
+                etree.strip_elements(root, "script", "style", with_tail=False)
+                page_text = " ".join(root.text_content().split())
+                result["emails"] = self._extract_emails_from_text(page_text)
+            return result, not (pdf_failed or img_failed)
 
         except Exception as e:  # noqa: BLE001
             result["error"] = str(e)
-            return result
+            return result, False
+
+    def _first_hit(self, fetch: Callable[[str, threading.Event], Optional[Dict]], urls: List[str]) -> Tuple[Optional[Dict], bool]:
+        """Run ``fetch`` over ``urls`` in parallel and return ``(first non-empty result, failed)``.
+
+        ``failed`` is True when nothing hit and at least one fetch raised (fetches swallow
+        permanent failures such as 4xx or undecodable bodies, and only raise on transient
+        ones), so callers can tell "no emails" apart from "could not look". Once a hit is found, queued fetches are
+        cancelled and running ones see ``stop`` set, so they skip their parse/OCR step.
+        """
+        if not urls:
+            return None, False
+        stop = threading.Event()
+        futures = [self._fetch_pool.submit(fetch, u, stop) for u in urls]
+        failed = False
+        try:
+            for future in as_completed(futures):
+                try:
+                    hit = future.result()
+                except Exception:  # noqa: BLE001
+                    failed = True
+                    continue
+                if hit:
+                    return hit, False
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+        return None, failed
+
+    def _analyze_pdf_content(self, content: bytes, sha: str) -> Tuple[List[str], List[str]]:
+        """Return (emails, qr_payloads) for a PDF body, memoised on its sha256."""
+        with _pdf_result_cache_lock:
+            cached = _pdf_result_cache.get(sha)
+            if cached is not None:
+                _pdf_result_cache.move_to_end(sha)
+        if cached is not None:
+            return list(cached[0]), list(cached[1])
+
+        emails, qr_payloads = self._analyze_pdf_bytes(content)
+        if qr_payloads:
+            qr_emails = (e for payload in qr_payloads for e in self._extract_emails_from_text(payload))
+            emails = list(dict.fromkeys(qr_emails))
+
+        with _pdf_result_cache_lock:
+            _pdf_result_cache[sha] = (tuple(emails), tuple(qr_payloads))
+            if len(_pdf_result_cache) > _PDF_RESULT_CACHE_SIZE:
+                _pdf_result_cache.popitem(last=False)
+        return emails, qr_payloads
+
+    def _try_pdf_candidate(self, pdf_url: str, stop: Optional[threading.Event] = None) -> Optional[Dict]:
+        try:
+            pdf_resp = self._get_with_backoff(pdf_url, stream=True)
+            content, sha = self._read_capped(pdf_resp)
+            if stop is not None and stop.is_set():
+                return None
+            emails, _ = self._analyze_pdf_content(content, sha)
+            if emails:
+                saved_path = self._persist_asset(content, sha, suggested_ext=".pdf")
+                return {
+                    "emails": emails,
+                    "url": pdf_url,
+                    "sha256": sha,
+                    "content_type": pdf_resp.headers.get("content-type", ""),
+                    "size_bytes": len(content),
+                    "saved_path": saved_path,
+                }
+        except (requests.HTTPError, _ResponseTooLarge) as inner_err:
+            # 4xx or oversized: retrying won't help, so this is "no hit" rather than a failure
+            logger.debug(f"Embedded PDF {pdf_url} unavailable: {inner_err}")
+        except Exception as inner_err:  # noqa: BLE001
+            logger.debug(f"Error fetching embedded PDF {pdf_url}: {inner_err}")
+            raise
+        return None
+
+    def _try_image_candidate(self, img_url: str, stop: Optional[threading.Event] = None) -> Optional[Dict]:
+        try:
+            img_resp = self._get_with_backoff(img_url, stream=True)
+            content, sha = self._read_capped(img_resp)
+            if stop is not None and stop.is_set():
+                return None
+            text = self._extract_text_from_image_bytes(content)
+            emails = self._extract_emails_from_text(text) if text else []
+            if emails:
+                saved_path = self._persist_asset(content, sha, suggested_ext=self._guess_ext_from_ct(img_resp.headers.get("content-type", "")) or ".img")
+                return {
+                    "emails": emails,
+                    "url": img_url,
+                    "sha256": sha,
+                    "content_type": img_resp.headers.get("content-type", ""),
+                    "size_bytes": len(content),
+                    "saved_path": saved_path,
+                }
+        except (requests.HTTPError, _ResponseTooLarge) as inner_err:
+            # 4xx or oversized: retrying won't help, so this is "no hit" rather than a failure
+            logger.debug(f"Image {img_url} unavailable: {inner_err}")
+        except Exception as inner_err:  # noqa: BLE001
+            logger.debug(f"Error OCR image {img_url}: {inner_err}")
+            raise
+        return None
 
     @staticmethod
     def _extract_emails_from_text(text: Optional[str]) -> List[str]:
-        if not text:
+        # Literal prefilter: most certificate text has no '@' at all
+        if not text or "@" not in text:
             return []
-        pattern = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
-        emails = pattern.findall(text)
+        if len(text) < _AT_WINDOW_MIN_TEXT:
+            emails = _EMAIL_RE.findall(text)
+        else:
+            emails = [e for window in _at_windows(text) for e in _EMAIL_RE.findall(window)]
         # Deduplicate while preserving order
-        unique: List[str] = []
-        seen = set()
-        for e in emails:
-            if e not in seen:
-                seen.add(e)
-                unique.append(e)
-        return unique
+        return list(dict.fromkeys(emails))
 
     @staticmethod
     def _infer_name_from_url(url: str) -> str:
         return url.rsplit("/", 1)[-1] or "certificate"
 
     @staticmethod
-    def _absolutize(base_url: str, ref: str) -> str:
-        from urllib.parse import urlparse, urljoin
+    def _pdfium_page_text(pdf, index: int) -> str:
+        """Text of one page; the caller must hold ``_PDFIUM_LOCK``."""
+        page = pdf[index]
         try:
-            if not ref:
-                return ref
-            # Already absolute
-            if re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*://', ref):
-                return ref
-            # Protocol-relative
-            if ref.startswith("//"):
-                return "https:" + ref
-            # Bare domain without scheme (e.g. image.made-in-china.com/path)
-            if re.match(r'^[A-Za-z0-9.-]+\.[A-Za-z]{2,}($|/|\?)', ref):
-                return "https://" + ref.lstrip('/')
-            # Otherwise, standard URL join
-            joined = urljoin(base_url if base_url.endswith('/') else base_url + '/', ref)
-            # Fix double host patterns like https://host/https://other/...
-            m = re.match(r'^(https?://[^/]+)/(https?://.+)$', joined)
-            if m:
-                return m.group(2)
-            # Fix accidental host-in-path like https://host/www.micstatic.com/...
-            host_in_path = re.match(r'^(https?://[^/]+)/(www\.[^/]+/.+)$', joined)
-            if host_in_path:
-                return "https://" + host_in_path.group(2)
-            return joined
-        except Exception:  # noqa: BLE001
-            return ref
+            textpage = page.get_textpage()
+            try:
+                return textpage.get_text_range() or ""
+            finally:
+                textpage.close()
+        finally:
+            page.close()
 
     @staticmethod
-    def _extract_text_from_pdf_bytes(pdf_bytes: bytes) -> Optional[str]:
-        """Try PyPDF2 first, fall back to pdfplumber."""
+    def _pypdf2_pages(pdf_bytes: bytes) -> Iterator[str]:
+        import PyPDF2  # type: ignore
+
+        reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        for page in reader.pages:
+            try:
+                yield page.extract_text() or ""
+            except Exception:  # noqa: BLE001
+                yield ""
+
+    @staticmethod
+    def _pdfplumber_pages(pdf_bytes: bytes) -> Iterator[str]:
+        import pdfplumber  # type: ignore
+
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            for page in pdf.pages:
+                try:
+                    yield page.extract_text() or ""
+                except Exception:  # noqa: BLE001
+                    yield ""
+
+    @classmethod
+    def _iter_pdf_pages(cls, pdf_bytes: bytes, backends: Tuple[Callable, ...]) -> Iterator[str]:
+        """Yield the text of each non-empty page.
+
+        ``backends`` are tried in order; the next is only used when the previous one is
+        missing or produced no text.
+        """
         if not pdf_bytes:
-            return None
+            return
+
+        for backend in backends:
+            found_text = False
+            try:
+                for page_text in backend(pdf_bytes):
+                    if page_text.strip():
+                        found_text = True
+                        yield page_text
+            except ImportError:
+                continue
+            except Exception as e:  # noqa: BLE001
+                logger.debug(f"{backend.__name__} failed to extract text: {e}")
+            if found_text:
+                return
+
+    @classmethod
+    def _find_emails_in_pdf(cls, pdf_bytes: bytes, backends: Tuple[Callable, ...]) -> List[str]:
+        """Scan page by page and stop extracting at the first page that contains emails."""
+        for page_text in cls._iter_pdf_pages(pdf_bytes, backends):
+            emails = cls._extract_emails_from_text(page_text)
+            if emails:
+                return emails
+        return []
+
+    @classmethod
+    def _analyze_pdf_bytes(cls, pdf_bytes: bytes) -> Tuple[List[str], List[str]]:
+        """Return ``(emails, qr_payloads)`` from a single parse of the PDF.
+
+        With pypdfium2 the document is opened once: pages are scanned for text until one
+        contains emails, and only if none does are the pages of that same document rendered
+        and QR-decoded. Without it, only the text backends are tried.
+        """
+        if not pdf_bytes:
+            return [], []
+        fallback = (cls._pypdf2_pages, cls._pdfplumber_pages)
+        try:
+            import pypdfium2 as pdfium  # type: ignore
+
+            with _PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(pdf_bytes)
+        except Exception as e:  # noqa: BLE001
+            if not isinstance(e, ImportError):
+                logger.debug(f"pypdfium2 could not open PDF: {e}")
+            return cls._find_emails_in_pdf(pdf_bytes, fallback), []
+
+        try:
+            found_text = False
+            with _PDFIUM_LOCK:
+                for index in range(len(pdf)):
+                    page_text = cls._pdfium_page_text(pdf, index)
+                    if page_text.strip():
+                        found_text = True
+                        emails = cls._extract_emails_from_text(page_text)
+                        if emails:
+                            return emails, []
+            if not found_text:
+                # No text layer as far as PDFium can tell; give the pure-Python extractors a go
+                emails = cls._find_emails_in_pdf(pdf_bytes, fallback)
+                if emails:
+                    return emails, []
+            return [], cls._qr_payloads_from_pdfium(pdf)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"pypdfium2 failed to analyze PDF: {e}")
+            return cls._find_emails_in_pdf(pdf_bytes, fallback), []
+        finally:
+            with _PDFIUM_LOCK:
+                pdf.close()
 
     @staticmethod
-    def _extract_qr_payloads_from_pdf_bytes(pdf_bytes: bytes) -> List[str]:
-        """Attempt to extract and decode QR codes embedded as images in a PDF.
+    def _qr_payloads_from_pdfium(pdf) -> List[str]:
+        """Decode QR codes from the pages of an open pypdfium2 document.
 
-        Best-effort: uses pdfplumber to locate image xrefs, extracts image bytes, decodes via pyzbar.
-        Returns list of decoded payload strings; empty list if none or on failure.
+        Pages are rasterized rather than walking embedded images, so QR codes drawn as
+        vector paths are found too, and each page costs one render plus one decode.
+        Only the render holds ``_PDFIUM_LOCK``; pyzbar works on a copy of the bitmap.
         """
-        payloads: List[str] = []
         try:
-            import pdfplumber  # type: ignore
-            from PIL import Image
-            from io import BytesIO
             from pyzbar.pyzbar import decode as qr_decode
+        except ImportError:
+            return []
 
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                for page in pdf.pages:
-                    # page.images contains dicts with object_id (xref)
-                    for img_meta in page.images:
+        payloads: List[str] = []
+        with _PDFIUM_LOCK:
+            n_pages = len(pdf)
+        for index in range(n_pages):
+            try:
+                with _PDFIUM_LOCK:
+                    page = pdf[index]
+                    try:
+                        bitmap = page.render(scale=_QR_RENDER_DPI / 72, grayscale=True)
                         try:
-                            xref = img_meta.get("object_id") or img_meta.get("xref")
-                            if xref is None:
-                                continue
-                            base_image = pdf.extract_image(xref)
-                            if not base_image:
-                                continue
-                            img_bytes = base_image.get("image")
-                            if not img_bytes:
-                                continue
-                            pil_img = Image.open(BytesIO(img_bytes))
-                            # Convert to RGB for safety
-                            try:
-                                pil_img = pil_img.convert("RGB")
-                            except Exception:
-                                pass
-                            decoded = qr_decode(pil_img)
-                            if decoded:
-                                for d in decoded:
-                                    try:
-                                        text = d.data.decode("utf-8", errors="ignore")
-                                    except Exception:
-                                        text = ""
-                                    if text and text not in payloads:
-                                        payloads.append(text)
-                        except Exception:
-                            # best-effort per image
-                            continue
-        except Exception:
-            return []
-        return payloads
+                            pixels = bitmap.to_numpy().copy()
+                        finally:
+                            bitmap.close()
+                    finally:
+                        page.close()
+                for d in qr_decode(pixels):
+                    text = d.data.decode("utf-8", errors="ignore")
+                    if text:
+                        payloads.append(text)
+            except Exception:  # noqa: BLE001
+                # best-effort per page
+                continue
+        return list(dict.fromkeys(payloads))
+
+    def _ocr(self, image, config: str = '--psm 6') -> str:
+        """OCR a PIL image or NumPy array.
+
+        Uses this thread's persistent tesserocr API (no process spawn or model reload per call)
+        when installed, otherwise pytesseract with the given ``config``.
+        """
+        api = self._tess_api()
+        if api is not None:
+            from PIL import Image
 
-        # Try PyPDF2
-        try:
-            import PyPDF2  # type: ignore
+            if not isinstance(image, Image.Image):
+                image = Image.fromarray(image)
+            # Honour the page segmentation mode from ``config``; tesserocr's PSM values match the CLI's
+            m = _PSM_RE.search(config)
+            api.SetPageSegMode(int(m.group(1)) if m else 6)
+            api.SetImage(image)
+            return api.GetUTF8Text()
 
-            reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
-            text_parts: List[str] = []
-            for page in reader.pages:
-                try:
-                    page_text = page.extract_text() or ""
-                except Exception:  # noqa: BLE001
-                    page_text = ""
-                text_parts.append(page_text)
-            text = " ".join(text_parts).strip()
-            if text:
-                return text
-        except Exception:  # noqa: BLE001
-            logger.debug("PyPDF2 failed; will try pdfplumber")
-
-        # Fallback to pdfplumber
+        import pytesseract
+
+        return pytesseract.image_to_string(image, config=config)
+
+    def _tess_api(self):
+        """Return the calling thread's tesserocr API, or None when tesserocr is unavailable."""
+        api = getattr(self._tess_local, "api", None)
+        if api is not None or self._tess_available is False:
+            return api
         try:
-            import pdfplumber  # type: ignore
+            from tesserocr import PyTessBaseAPI, PSM, OEM  # type: ignore
 
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                text_parts: List[str] = []
-                for page in pdf.pages:
-                    try:
-                        page_text = page.extract_text() or ""
-                    except Exception:  # noqa: BLE001
-                        page_text = ""
-                    text_parts.append(page_text)
-            text = " ".join(text_parts).strip()
-            return text or None
-        except Exception:  # noqa: BLE001
-            logger.debug("pdfplumber failed to extract text")
+            api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"tesserocr unavailable; using pytesseract: {e}")
+            self._tess_available = False
             return None
+        self._tess_available = True
+        self._tess_local.api = api
+        with self._tess_lock:
+            self._tess_apis.append(api)
+        return api
 
-    @staticmethod
-    def _extract_text_from_image_bytes(image_bytes: bytes) -> Optional[str]:
-        """Run OCR on image content using Tesseract via pytesseract."""
+    def _extract_text_from_image_bytes(self, image_bytes: bytes) -> Optional[str]:
+        """Run OCR on image content using Tesseract (tesserocr or pytesseract).
+
+        Returns None for empty or undecodable images; raises if Tesseract is unusable.
+        """
         if not image_bytes:
             return None
         try:
             from PIL import Image
-            import pytesseract
             from pyzbar.pyzbar import decode as qr_decode
 
             with io.BytesIO(image_bytes) as bio:
-                img = Image.open(bio)
-                # Convert to RGB for safety (some formats are palette/CMYK)
                 try:
-                    img = img.convert("RGB")
-                except Exception:  # noqa: BLE001
+                    # Converting to RGB forces the full decode (and handles palette/CMYK formats)
+                    img = Image.open(bio).convert("RGB")
+                except Exception as e:  # noqa: BLE001
+                    # A corrupt or unsupported body won't decode on retry either: no text, not a failure
+                    logger.debug(f"Undecodable image: {e}")
+                    return None
+                # QR payloads are exact where OCR is a guess; skip Tesseract entirely
+                # when one already carries an email
+                qr_texts: List[str] = []
+                try:
+                    qr_texts = [d.data.decode('utf-8', errors='ignore') for d in qr_decode(img)]
+                except Exception:
                     pass
-                # Basic preprocessing: grayscale + threshold
+                qr_text = "\n".join(t for t in qr_texts if t)
+                if qr_text and _EMAIL_RE.search(qr_text):
+                    return qr_text
+                # Early-exit ladder: binarized block OCR, then one column-layout retry if it found nothing
                 try:
                     gray = img.convert('L')
-                    # Simple global threshold
-                    bw = gray.point(lambda p: 255 if p > 180 else 0, '1')
-                    text = pytesseract.image_to_string(bw, config='--psm 6')
-                    if not text.strip():
-                        text = pytesseract.image_to_string(gray, config='--psm 6')
+                    bw = self._binarize_for_ocr(gray)
+                    text = self._ocr(bw, config='--oem 1 --psm 6')
                     if not text.strip():
-                        text = pytesseract.image_to_string(img, config='--oem 1 --psm 6')
+                        text = self._ocr(gray, config='--oem 1 --psm 4')
                 except Exception:
-                    text = pytesseract.image_to_string(img)
-                text = (text or "").strip()
-                # Try QR code decoding and append payloads
-                try:
-                    decoded = qr_decode(img)
-                    if decoded:
-                        qr_texts = [d.data.decode('utf-8', errors='ignore') for d in decoded]
-                        text = (text + "\n" + "\n".join(qr_texts)).strip()
-                except Exception:
-                    pass
+                    text = self._ocr(img, config='')
+                text = ((text or "").strip() + "\n" + qr_text).strip()
                 return text or None
         except Exception as e:  # noqa: BLE001
+            # Propagate so callers don't mistake a broken OCR setup for "no emails"
             logger.debug(f"OCR failed: {e}")
-            return None
+            raise
+
+    @staticmethod
+    def _binarize_for_ocr(gray):
+        """Binarize a grayscale PIL image for OCR; returns a NumPy array or PIL image.
+
+        With OpenCV installed: CLAHE contrast equalisation followed by an adaptive threshold,
+        which copes with dim or unevenly lit scans. Otherwise the global LUT threshold.
+        """
+        try:
+            import cv2  # type: ignore
+            import numpy as np
+
+            # Reuse the grayscale image PIL already decoded instead of decoding the bytes again
+            arr = np.asarray(gray, dtype=np.uint8)
+            arr = _clahe(cv2).apply(arr)
+            return cv2.adaptiveThreshold(arr, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10)
+        except ImportError:
+            pass
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"OpenCV threshold failed; using global threshold: {e}")
+        # Simple global threshold
+        return gray.point(_OCR_BW_LUT, '1')
 
     @staticmethod
     def _guess_ext_from_ct(content_type: str) -> Optional[str]:
@@ -404,17 +824,32 @@ class PDFExtractor:
         if 'pdf' in ct: return '.pdf'
         return None
 
-    @staticmethod
-    def _persist_asset(content: bytes, suggested_ext: str = ".bin") -> tuple[str, str]:
-        sha = hashlib.sha256(content).hexdigest()
-        assets_dir = os.path.join(DATA_DIR, "assets")
-        os.makedirs(assets_dir, exist_ok=True)
-        filename = f"{sha}{suggested_ext}"
-        path = os.path.join(assets_dir, filename)
-        if not os.path.exists(path):
-            with open(path, 'wb') as f:
+    def _persist_asset(self, content: bytes, sha: str, suggested_ext: str = ".bin") -> Optional[str]:
+        """Store ``content`` under its (precomputed) SHA-256 name; returns the path.
+
+        Best-effort: returns None if the asset cannot be written, so a storage problem
+        never discards emails that were already extracted.
+        """
+        path = os.path.join(self._assets_dir, f"{sha}{suggested_ext}")
+        if os.path.exists(path):
+            return path
+        # Write to a temp file and rename so no one (including a later run after a crash) ever
+        # sees a partial asset; names are content-addressed, so a concurrent replace is harmless
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self._assets_dir, prefix=f".{sha}.", suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
                 f.write(content)
-        return sha, path
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not save asset {path}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return None
+        return path
 
 
 
@@ -106,7 +106,7 @@ class MadeInChinaScraper:
                 response = self.session.get(url)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Extract total results count
                 if page == 1:
@@ -806,7 +806,7 @@ class MadeInChinaScraper:
             response = self.session.get(product_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract detailed information
             title = self._extract_text(soup, [".product-title", ".title", "h1"])
@@ -875,7 +875,7 @@ class MadeInChinaScraper:
             response = self.session.get(seller_profile_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract seller information
             seller_name = self._extract_text(soup, [".company-name", ".company-title", "h1", ".title"])
@@ -967,6 +967,7 @@ class MadeInChinaScraper:
         """Close the scraper and cleanup resources"""
         if self.driver:
             self.driver.quit()
+        self.pdf_extractor.close()
         self.session.close()
     
     def _extract_min_order_quantity(self, element) -> Optional[int]:
@@ -1203,6 +1204,8 @@ class MadeInChinaScraper:
                             data_url = clickable_parent.get('data-url', '')
                             if 'certificate' in onclick.lower() or 'certificate' in data_url.lower():
                                 certificate_images.append(data_url)
+            # Selectors overlap (an image can match several), so keep the first, highest-priority hit
+            certificate_images = list(dict.fromkeys(certificate_images))
             
             logger.debug(f"Found {len(certificate_images)} certificate image links")
             
@@ -1342,7 +1345,7 @@ class MadeInChinaScraper:
                                 return email
                     else:
                         # If not a PDF, it might be a page with embedded PDF
-                        cert_soup = BeautifulSoup(response.content, 'html.parser')
+                        cert_soup = BeautifulSoup(response.content, 'lxml')
                         
                         # Look for embedded PDF or iframe
                         pdf_embed = cert_soup.find('embed', attrs={'type': 'application/pdf'})
@@ -1887,7 +1890,7 @@ class MadeInChinaScraper:
             response = requests.get(product_url, headers=HEADERS, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract HS Code
             hs_code = self._extract_hs_code_from_page(soup)
@@ -1989,7 +1992,7 @@ class MadeInChinaScraper:
             response = self.session.get(company_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             profile_data = {
                 'company_name': self._extract_company_name(soup),
@@ -2892,7 +2895,7 @@ class MadeInChinaScraper:
             response = self.session.get(company_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             certificates = []
             